@@ -22,6 +22,24 @@ class CupDetector {
     this._alpha = 0.07; // EMA smoothing factor (lower = less jitter)
     this._missCount = 0; // consecutive missed frames
     this.confidence = 0; // 0–1 detection confidence
+
+    // Hough vote directions: unit-circle samples are constant, so tabulate once
+    this._nAng = 16;
+    this._cosTab = new Float64Array(this._nAng);
+    this._sinTab = new Float64Array(this._nAng);
+    const dA = (Math.PI * 2) / this._nAng;
+    for (let a = 0; a < this._nAng; a++) {
+      this._cosTab[a] = Math.cos(a * dA);
+      this._sinTab[a] = Math.sin(a * dA);
+    }
+
+    // Scratch buffers reused by every detect() call (no per-frame allocation)
+    const n = this.DW * this.DH;
+    this._gray = new Uint8Array(n);
+    this._edges = new Uint8Array(n); // border pixels are never written → stay 0
+    this._acc = new Float32Array((this.DW >> 1) * (this.DH >> 1));
+    this._ep = new Uint16Array(n * 2); // edge pixel x,y pairs
+    this._rScore = new Uint16Array(Math.min(this.DW, this.DH) >> 1); // votes per radius bin
   }
 
   /**
@@ -85,7 +103,7 @@ class CupDetector {
 
   _toGray(data) {
     const n = this.DW * this.DH;
-    const g = new Uint8Array(n);
+    const g = this._gray;
     for (let i = 0; i < n; i++) {
       // Rec. 601 luma
       g[i] =
@@ -97,7 +115,7 @@ class CupDetector {
   _sobel(g) {
     const W = this.DW,
       H = this.DH;
-    const out = new Uint8Array(W * H);
+    const out = this._edges;
     for (let y = 1; y < H - 1; y++) {
       for (let x = 1; x < W - 1; x++) {
         const gx =
@@ -126,27 +144,32 @@ class CupDetector {
     const THR = 28;
 
     // Collect edge pixel coordinates
-    const ep = [];
+    const ep = this._ep;
+    let epLen = 0; // ep stores x,y pairs → epLen/2 points
     for (let y = 1; y < H - 1; y++) {
       for (let x = 1; x < W - 1; x++) {
-        if (edges[y * W + x] > THR) ep.push(x, y);
+        if (edges[y * W + x] > THR) {
+          ep[epLen++] = x;
+          ep[epLen++] = y;
+        }
       }
     }
-    if (ep.length < 16) return null;
+    if (epLen < 16) return null;
 
     const minR = 6;
     const maxR = Math.min(W, H) / 2 - 2;
     const rStep = 2;
-    const nAng = 16;
-    const dA = (Math.PI * 2) / nAng;
+    const nAng = this._nAng;
+    const cosTab = this._cosTab;
+    const sinTab = this._sinTab;
 
     // Accumulator at half resolution to save memory/time
     const AW = W >> 1;
     const AH = H >> 1;
-    const acc = new Float32Array(AW * AH);
+    const acc = this._acc;
+    acc.fill(0);
 
     // Skip edge pixels to stay within budget (~100 points max)
-    const epLen = ep.length; // ep stores x,y pairs → epLen/2 points
     const skip = Math.max(2, Math.floor(epLen / 200)); // skip by 2 coords at a time
 
     for (let i = 0; i < epLen; i += skip * 2) {
@@ -154,8 +177,8 @@ class CupDetector {
         ey = ep[i + 1];
       for (let r = minR; r < maxR; r += rStep) {
         for (let a = 0; a < nAng; a++) {
-          const cx = Math.round(ex - r * Math.cos(a * dA)) >> 1;
-          const cy = Math.round(ey - r * Math.sin(a * dA)) >> 1;
+          const cx = Math.round(ex - r * cosTab[a]) >> 1;
+          const cy = Math.round(ey - r * sinTab[a]) >> 1;
           if (cx >= 0 && cx < AW && cy >= 0 && cy < AH) {
             acc[cy * AW + cx] += 1;
           }
@@ -177,19 +200,30 @@ class CupDetector {
     const cx = (bestI % AW) * 2 + 1;
     const cy = Math.floor(bestI / AW) * 2 + 1;
 
-    // Verify: find the best-fitting radius for this center
+    // Verify: find the best-fitting radius for this center.
+    // Single pass: each edge point computes its distance once and votes for
+    // the (at most 3) radius bins within 3px, instead of rescanning all
+    // edge points for every candidate radius.
+    const nR = Math.ceil((maxR - minR) / rStep);
+    const rScore = this._rScore;
+    rScore.fill(0);
+    for (let i = 0; i < epLen; i += skip * 2) {
+      const dx = ep[i] - cx,
+        dy = ep[i + 1] - cy;
+      const d = Math.sqrt(dx * dx + dy * dy);
+      const kLo = Math.max(0, Math.floor((d - 3 - minR) / rStep));
+      const kHi = Math.min(nR - 1, Math.ceil((d + 3 - minR) / rStep));
+      for (let k = kLo; k <= kHi; k++) {
+        if (Math.abs(d - (minR + k * rStep)) < 3) rScore[k]++;
+      }
+    }
+
     let bestR = minR,
       bestScore = 0;
-    for (let r = minR; r < maxR; r += rStep) {
-      let score = 0;
-      for (let i = 0; i < epLen; i += skip * 2) {
-        const dx = ep[i] - cx,
-          dy = ep[i + 1] - cy;
-        if (Math.abs(Math.sqrt(dx * dx + dy * dy) - r) < 3) score++;
-      }
-      if (score > bestScore) {
-        bestScore = score;
-        bestR = r;
+    for (let k = 0; k < nR; k++) {
+      if (rScore[k] > bestScore) {
+        bestScore = rScore[k];
+        bestR = minR + k * rStep;
       }
     }
 